@@ -25,15 +25,14 @@ Example:
         plugin.run()
 """
 
-import copy
-import json
 import os
 import re
-import string
 import warnings
 
 import logging.config
 
+import six
+
 import brewtils
 
 DEFAULT_LOGGERS = {
@@ -64,10 +63,90 @@ DEFAULT_PLUGIN_LOGGING_TEMPLATE = {
     "root": DEFAULT_ROOT,
 }
 
+# Template substitution on the logging configuration is done ConfigParser-style
+# (%(variable)s), consistent with how the logging module itself does substitution
+# on Python 2. Only the keyword arguments of configure_logging are substituted, so
+# the pattern is built from those names once rather than using a general-purpose
+# string.Template. A doubled delimiter ("%%") is an escape for a literal "%" and
+# any other use of the delimiter is left alone.
+_TEMPLATE_KEYS = ("namespace", "system_name", "system_version", "instance_name")
+_TEMPLATE_PATTERN = re.compile(
+    r"%(?:(%)|\(({keys})\)s|({keys})(?![_a-zA-Z0-9]))".format(
+        keys="|".join(_TEMPLATE_KEYS)
+    )
+)
+
+
+def _template(text, mapping):
+    """Substitute the known template keys in a single string
+
+    All values in mapping must already be strings.
+    """
+    # Most values (class names, levels, etc.) contain no delimiter at all
+    if "%" not in text:
+        return text
+
+    def replace(match):
+        escaped, braced, named = match.groups()
+        if escaped:
+            return escaped
+        return mapping[braced or named]
+
+    return _TEMPLATE_PATTERN.sub(replace, text)
+
+
+def _substitute(node, mapping):
+    """Recursively template all strings, including dict keys
+
+    Tuples are returned as lists, the same as a JSON round-trip would produce.
+    """
+    if isinstance(node, dict):
+        return {
+            _substitute(k, mapping): _substitute(v, mapping) for k, v in node.items()
+        }
+    if isinstance(node, (list, tuple)):
+        return [_substitute(x, mapping) for x in node]
+    if isinstance(node, six.string_types):
+        return _template(node, mapping)
+    return node
+
+
+def _handler_dir(filename):
+    """Get the normalized directory of a handler file
+
+    Only relative paths need abspath (and with it, getcwd).
+    """
+    if os.path.isabs(filename):
+        return os.path.dirname(os.path.normpath(filename))
+    return os.path.dirname(os.path.abspath(filename))
+
+
+def _copy_defaults(defaults):
+    """Copy a defaults mapping, which is always a dict of flat dicts"""
+    return {k: dict(v) for k, v in defaults.items()}
+
+
+def _copy_template(exclude=()):
+    """Copy DEFAULT_PLUGIN_LOGGING_TEMPLATE without using copy.deepcopy
+
+    Keys in exclude are left out, for callers that would only replace them.
+    """
+    config = {
+        k: _copy_defaults(v) if isinstance(v, dict) else v
+        for k, v in DEFAULT_PLUGIN_LOGGING_TEMPLATE.items()
+        if k not in exclude and k != "root"
+    }
+
+    if "root" not in exclude:
+        root = DEFAULT_PLUGIN_LOGGING_TEMPLATE["root"]
+        config["root"] = dict(root, handlers=list(root["handlers"]))
+
+    return config
+
 
 def default_config(level="INFO"):
     """Get a basic logging configuration with the given level"""
-    config = copy.deepcopy(DEFAULT_PLUGIN_LOGGING_TEMPLATE)
+    config = _copy_template()
     config["root"]["level"] = level
 
     return config
@@ -115,52 +194,27 @@ def configure_logging(
     Returns:
         None
     """
-
-    class ConfigParserTemplate(string.Template):
-        """string.Template variant for ConfigParser-style interpolation
-
-        So. This exists because we want to do template substitution on the logging
-        configuration file. We want this to be consistent with how the logging module
-        itself does substitution, and since we need this to work on Python 2 that means
-        the ConfigParser flavor: %(variable)s
-
-        The important parts here that differ from the normal string.Template are:
-        - The delimiter ("%" instead of "$")
-        - The "delimiter and a braced identifier" part of the pattern definition. This
-          is needed to match %(variable)s instead of %{variable} like a normal template
-        - The "id" and additional field "bid" in Python 3.7 are slightly different:
-          r"(?a:[_a-z][_a-z0-9]*)" instead of r"[_a-z][_a-z0-9]*"
-          Hopefully that's not a problem.
-        """
-
-        delimiter = "%"
-
-        pattern = r"""
-        %(delim)s(?:
-          (?P<escaped>%(delim)s)    |   # Escape sequence of two delimiters
-          (?P<named>%(id)s)         |   # delimiter and a Python identifier
-          \((?P<braced>%(id)s)\)s  |   # delimiter and a braced identifier
-          (?P<invalid>)                 # Other ill-formed delimiter exprs
-        )
-        """ % {
-            "delim": re.escape("%"),
-            "id": r"[_a-z][_a-z0-9]*",
-        }
-
-    templated = ConfigParserTemplate(json.dumps(raw_config)).safe_substitute(
-        namespace=namespace,
-        system_name=system_name,
-        system_version=system_version,
-        instance_name=instance_name,
+    # Format the values once up front instead of for every placeholder
+    mapping = {
+        "namespace": namespace,
+        "system_name": system_name,
+        "system_version": system_version,
+        "instance_name": instance_name,
+    }
+    logging_config = _substitute(
+        raw_config, {k: "%s" % (v,) for k, v in mapping.items()}
     )
-    logging_config = json.loads(templated)
 
-    # Now make sure that directories for all file handlers exist
-    for handler in logging_config["handlers"].values():
-        if "filename" in handler:
-            dir_name = os.path.dirname(os.path.abspath(handler["filename"]))
-            if not os.path.exists(dir_name):
-                os.makedirs(dir_name)
+    # Now make sure that directories for all file handlers exist. Handlers commonly
+    # share a directory, so only check each one once
+    dir_names = {
+        _handler_dir(handler["filename"])
+        for handler in logging_config["handlers"].values()
+        if "filename" in handler
+    }
+    for dir_name in dir_names:
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
 
     logging.config.dictConfig(logging_config)
 
@@ -232,18 +286,18 @@ def convert_logging_config(logging_config):
         stacklevel=2,
     )
 
-    config_to_return = copy.deepcopy(DEFAULT_PLUGIN_LOGGING_TEMPLATE)
+    config_to_return = _copy_template(exclude=("handlers", "formatters", "root"))
 
     if logging_config.handlers:
         handlers = logging_config.handlers
     else:
-        handlers = copy.deepcopy(DEFAULT_HANDLERS)
+        handlers = _copy_defaults(DEFAULT_PLUGIN_LOGGING_TEMPLATE["handlers"])
     config_to_return["handlers"] = handlers
 
     if logging_config.formatters:
         formatters = logging_config.formatters
     else:
-        formatters = copy.deepcopy(DEFAULT_FORMATTERS)
+        formatters = _copy_defaults(DEFAULT_PLUGIN_LOGGING_TEMPLATE["formatters"])
     config_to_return["formatters"] = formatters
 
     config_to_return["root"] = {
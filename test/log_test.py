@@ -9,6 +9,8 @@ from mock import MagicMock, Mock
 from brewtils.log import (
     DEFAULT_FORMATTERS,
     DEFAULT_HANDLERS,
+    DEFAULT_LOGGERS,
+    DEFAULT_PLUGIN_LOGGING_TEMPLATE,
     configure_logging,
     convert_logging_config,
     default_config,
@@ -38,6 +40,10 @@ class TestLog(object):
         log_config = default_config(level="DEBUG")
         assert log_config["root"]["level"] == "DEBUG"
 
+        log_config["root"]["handlers"].append("file")
+        log_config["handlers"]["default"]["stream"] = "ext://sys.stderr"
+        assert default_config() == DEFAULT_PLUGIN_LOGGING_TEMPLATE
+
     def test_configure_logging(self, tmpdir, params, monkeypatch):
         raw_config = {
             "handlers": {
@@ -65,6 +71,107 @@ class TestLog(object):
         mangled_config = config_mock.call_args[0][0]
         assert "foo" in mangled_config["handlers"]["file"]["filename"]
 
+    def test_configure_logging_relative_filename(self, tmpdir, monkeypatch):
+        raw_config = {
+            "handlers": {
+                "file": {
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": os.path.join("log", "%(system_name)s.log"),
+                },
+                "err": {
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": os.path.join("log", "%(system_name)s.err.log"),
+                },
+            }
+        }
+
+        monkeypatch.chdir(tmpdir)
+        monkeypatch.setattr(logging.config, "dictConfig", Mock())
+
+        configure_logging(raw_config, system_name="foo")
+
+        assert os.path.isdir(os.path.join(str(tmpdir), "log"))
+
+    def test_configure_logging_parent_reference(self, tmpdir, monkeypatch):
+        raw_config = {
+            "handlers": {
+                "file": {
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": os.path.join(
+                        str(tmpdir), "log", "missing", "..", "%(system_name)s.log"
+                    ),
+                }
+            }
+        }
+
+        monkeypatch.setattr(logging.config, "dictConfig", Mock())
+
+        configure_logging(raw_config, system_name="foo")
+
+        assert os.path.isdir(os.path.join(str(tmpdir), "log"))
+        assert not os.path.exists(os.path.join(str(tmpdir), "log", "missing"))
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("%(system_name)s-%(system_version)s", "foo-1.0"),
+            ("%system_name.%instance_name", "foo.inst"),
+            ("%(asctime)s %(name)s", "%(asctime)s %(name)s"),
+            ("%system_names", "%system_names"),
+            ("100%% %%(namespace)s", "100% %(namespace)s"),
+        ],
+    )
+    def test_configure_logging_templating(self, monkeypatch, raw, expected):
+        config_mock = Mock()
+        monkeypatch.setattr(logging.config, "dictConfig", config_mock)
+
+        configure_logging(
+            {"handlers": {}, "formatters": {"default": {"format": raw}}},
+            namespace="ns",
+            system_name="foo",
+            system_version="1.0",
+            instance_name="inst",
+        )
+
+        mangled_config = config_mock.call_args[0][0]
+        assert mangled_config["formatters"]["default"]["format"] == expected
+
+    def test_configure_logging_keys_and_tuples(self, monkeypatch):
+        raw_config = {
+            "handlers": {},
+            "loggers": {"%(system_name)s": {"handlers": ("%(system_name)s",)}},
+        }
+
+        config_mock = Mock()
+        monkeypatch.setattr(logging.config, "dictConfig", config_mock)
+
+        configure_logging(raw_config, system_name="foo")
+
+        mangled_config = config_mock.call_args[0][0]
+        assert mangled_config["loggers"] == {"foo": {"handlers": ["foo"]}}
+
+    def test_configure_logging_special_characters(self, tmpdir, monkeypatch):
+        raw_config = {
+            "handlers": {
+                "file": {
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": os.path.join(str(tmpdir), "%(system_name)s.log"),
+                }
+            },
+            "root": {"level": "INFO", "handlers": ["file"]},
+        }
+
+        config_mock = Mock()
+        monkeypatch.setattr(logging.config, "dictConfig", config_mock)
+
+        configure_logging(raw_config, system_name='fo"o\\')
+
+        mangled_config = config_mock.call_args[0][0]
+        assert mangled_config["handlers"]["file"]["filename"] == os.path.join(
+            str(tmpdir), 'fo"o\\.log'
+        )
+        assert mangled_config["root"] == raw_config["root"]
+
 
 class TestFindLogFile(object):
     def test_success(self, monkeypatch):
@@ -150,6 +257,7 @@ class TestDeprecated(object):
             assert "handlers" in python_config["root"]
             assert "level" == python_config["root"]["level"]
             assert set(handlers) == set(python_config["root"]["handlers"])
+            assert isinstance(python_config["root"]["handlers"], list)
 
             assert len(w) == 1
             assert w[0].category == DeprecationWarning
@@ -163,6 +271,15 @@ class TestDeprecated(object):
             python_config = convert_logging_config(log_config)
             assert python_config["handlers"] == DEFAULT_HANDLERS
             assert python_config["formatters"] == DEFAULT_FORMATTERS
+            assert set(python_config) == set(DEFAULT_PLUGIN_LOGGING_TEMPLATE)
+            for key in ("version", "disable_existing_loggers", "loggers"):
+                assert python_config[key] == DEFAULT_PLUGIN_LOGGING_TEMPLATE[key]
+
+            # Modifying the returned config must not touch the defaults
+            python_config["handlers"]["default"]["stream"] = "ext://sys.stderr"
+            python_config["loggers"]["pika"]["level"] = "DEBUG"
+            assert DEFAULT_HANDLERS["default"]["stream"] == "ext://sys.stdout"
+            assert DEFAULT_LOGGERS["pika"]["level"] == "ERROR"
 
             assert len(w) == 1
             assert w[0].category == DeprecationWarning